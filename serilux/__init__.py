@@ -5,33 +5,9 @@ Provides flexible serialization and deserialization capabilities with
 automatic type registration and validation.
 """
 
-from serilux.exceptions import (
-    CallableError,
-    CircularReferenceError,
-    ClassNotFoundError,
-    DepthLimitError,
-    DeserializationError,
-    InvalidFieldError,
-    SerializationError,
-    SeriluxError,
-    UnknownFieldError,
-    ValidationError,
-)
-from serilux.serializable import (
-    ObjectRegistry,
-    Serializable,
-    SerializableRegistry,
-    check_serializable_constructability,
-    deserialize_callable,
-    deserialize_lambda_expression,
-    extract_callable_expression,
-    register_serializable,
-    serialize_callable,
-    serialize_callable_with_fallback,
-    validate_serializable_tree,
-)
+import importlib
 
-__all__ = [
+_SERIALIZABLE_EXPORTS = (
     # Core classes
     "Serializable",
     "SerializableRegistry",
@@ -46,7 +22,9 @@ __all__ = [
     "deserialize_callable",
     "deserialize_lambda_expression",
     "extract_callable_expression",
-    # Exceptions
+)
+
+_EXCEPTION_EXPORTS = (
     "SeriluxError",
     "SerializationError",
     "DeserializationError",
@@ -57,6 +35,34 @@ __all__ = [
     "CallableError",
     "InvalidFieldError",
     "UnknownFieldError",
-]
+)
+
+__all__ = _SERIALIZABLE_EXPORTS + _EXCEPTION_EXPORTS
 
 __version__ = "0.4.0"
+
+# Public names are resolved lazily on first access (PEP 562) so that
+# ``import serilux`` does not load the whole framework up front.
+_LAZY = {
+    **dict.fromkeys(_SERIALIZABLE_EXPORTS, "serilux.serializable"),
+    **dict.fromkeys(_EXCEPTION_EXPORTS, "serilux.exceptions"),
+}
+
+# Submodules that a bare ``import serilux`` used to bind as attributes.
+_SUBMODULES = ("serializable", "exceptions")
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    try:
+        mod_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(mod_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
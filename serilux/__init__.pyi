@@ -1,6 +1,6 @@
 """Type stubs for serilux package."""
 
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 class Serializable:
     """Base class for serializable objects."""
@@ -53,4 +53,4 @@ def extract_callable_expression(func: Callable[..., Any]) -> Optional[str]: ...
 
 __version__: str
 __version__ = "0.4.0"
-__all__: List[str]
+__all__: Tuple[str, ...]
@@ -4,58 +4,69 @@ This module defines a hierarchy of exceptions for different error scenarios
 that can occur during serialization and deserialization.
 """
 
+import copyreg
+
 
 class SeriluxError(Exception):
     """Base exception for all Serilux errors."""
 
-    pass
+    __slots__ = ()
 
+    def __reduce__(self):
+        # BaseException only pickles ``__dict__`` and re-runs ``__init__`` with
+        # the formatted message; rebuild via ``__new__`` and restore slots instead.
+        state = dict(self.__dict__)
+        for klass in type(self).__mro__:
+            slots = klass.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                if name not in ("__dict__", "__weakref__") and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return copyreg.__newobj__, (type(self), *self.args), state
 
-class SerializationError(SeriluxError):
-    """Exception raised when serialization fails."""
+
+class _FieldedError(SeriluxError):
+    """Common base for errors that carry an optional object type and field."""
+
+    __slots__ = ("obj_type", "field")
 
     def __init__(self, message: str, obj_type: str = None, field: str = None):
-        """Initialize a SerializationError.
+        """Initialize the error.
 
         Args:
             message: Error message
-            obj_type: Type of object being serialized (optional)
+            obj_type: Type of object being processed (optional)
             field: Field that caused the error (optional)
         """
         self.obj_type = obj_type
         self.field = field
-        parts = [message]
-        if obj_type:
-            parts.append(f"Object type: {obj_type}")
-        if field:
-            parts.append(f"Field: {field}")
-        super().__init__(": ".join(parts))
+        if obj_type and field:
+            message = f"{message}: Object type: {obj_type}: Field: {field}"
+        elif obj_type:
+            message = f"{message}: Object type: {obj_type}"
+        elif field:
+            message = f"{message}: Field: {field}"
+        super().__init__(message)
 
 
-class DeserializationError(SeriluxError):
-    """Exception raised when deserialization fails."""
+class SerializationError(_FieldedError):
+    """Exception raised when serialization fails."""
 
-    def __init__(self, message: str, obj_type: str = None, field: str = None):
-        """Initialize a DeserializationError.
+    __slots__ = ()
 
-        Args:
-            message: Error message
-            obj_type: Type of object being deserialized (optional)
-            field: Field that caused the error (optional)
-        """
-        self.obj_type = obj_type
-        self.field = field
-        parts = [message]
-        if obj_type:
-            parts.append(f"Object type: {obj_type}")
-        if field:
-            parts.append(f"Field: {field}")
-        super().__init__(": ".join(parts))
+
+class DeserializationError(_FieldedError):
+    """Exception raised when deserialization fails."""
+
+    __slots__ = ()
 
 
 class ClassNotFoundError(DeserializationError):
     """Exception raised when a class is not found in the registry."""
 
+    __slots__ = ("class_name",)
+
     def __init__(self, class_name: str):
         """Initialize a ClassNotFoundError.
 
@@ -72,6 +83,8 @@ class ClassNotFoundError(DeserializationError):
 class ValidationError(SeriluxError):
     """Exception raised when validation fails."""
 
+    __slots__ = ("obj",)
+
     def __init__(self, message: str, obj=None):
         """Initialize a ValidationError.
 
@@ -88,6 +101,8 @@ class ValidationError(SeriluxError):
 class CircularReferenceError(SerializationError):
     """Exception raised when a circular reference is detected."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Circular reference detected"):
         """Initialize a CircularReferenceError.
 
@@ -100,6 +115,8 @@ class CircularReferenceError(SerializationError):
 class DepthLimitError(SerializationError):
     """Exception raised when serialization depth limit is exceeded."""
 
+    __slots__ = ("max_depth", "current_depth")
+
     def __init__(self, max_depth: int, current_depth: int = None):
         """Initialize a DepthLimitError.
 
@@ -135,6 +152,8 @@ class CallableError(SeriluxError):
 class InvalidFieldError(SerializationError):
     """Exception raised when an invalid field is encountered."""
 
+    __slots__ = ("field_name",)
+
     def __init__(self, field_name: str, reason: str = None):
         """Initialize an InvalidFieldError.
 
@@ -152,6 +171,8 @@ class InvalidFieldError(SerializationError):
 class UnknownFieldError(DeserializationError):
     """Exception raised when an unknown field is encountered during deserialization."""
 
+    __slots__ = ("field_name",)
+
     def __init__(self, field_name: str, obj_type: str):
         """Initialize an UnknownFieldError.
 
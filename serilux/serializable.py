@@ -6,6 +6,7 @@ Generic serialization/deserialization for objects and callable types.
 
 import importlib
 import inspect
+from itertools import repeat
 from typing import Any, Callable, Dict, List, Optional
 
 from serilux.exceptions import (
@@ -249,7 +250,7 @@ class Serializable:
         Raises:
             InvalidFieldError: If any provided field is not a string.
         """
-        if not all(isinstance(field, str) for field in fields):
+        if not all(map(isinstance, fields, repeat(str))):
             raise InvalidFieldError(field_name="multiple", reason="All fields must be strings")
         self.fields_to_serialize.extend(fields)
         self.fields_to_serialize = list(set(self.fields_to_serialize))
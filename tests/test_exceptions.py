@@ -0,0 +1,138 @@
+"""
+Tests for Serilux exception classes.
+"""
+
+import pickle
+from unittest.mock import Mock
+
+import pytest
+
+from serilux import (
+    ClassNotFoundError,
+    DepthLimitError,
+    DeserializationError,
+    InvalidFieldError,
+    SerializationError,
+    UnknownFieldError,
+    ValidationError,
+)
+
+
+class TestExceptionMessages:
+    """Test exception message formatting."""
+
+    @pytest.mark.parametrize("exc_class", [SerializationError, DeserializationError])
+    def test_message_formatting(self, exc_class):
+        """Test that optional object type and field are appended to the message."""
+        assert str(exc_class("boom")) == "boom"
+        assert str(exc_class("boom", obj_type="Foo")) == "boom: Object type: Foo"
+        assert str(exc_class("boom", field="bar")) == "boom: Field: bar"
+        assert (
+            str(exc_class("boom", obj_type="Foo", field="bar"))
+            == "boom: Object type: Foo: Field: bar"
+        )
+
+    @pytest.mark.parametrize("exc_class", [SerializationError, DeserializationError])
+    def test_attributes(self, exc_class):
+        """Test that object type and field are kept as attributes."""
+        error = exc_class("boom", obj_type="Foo", field="bar")
+        assert error.obj_type == "Foo"
+        assert error.field == "bar"
+
+    def test_invalid_field_error(self):
+        """Test InvalidFieldError message and attributes."""
+        error = InvalidFieldError("x", reason="bad")
+        assert str(error) == "Invalid field 'x': bad: Field: x"
+        assert error.field_name == "x"
+        assert error.field == "x"
+
+    def test_unknown_field_error(self):
+        """Test UnknownFieldError message and attributes."""
+        error = UnknownFieldError("x", "Foo")
+        assert str(error) == "Unknown field 'x' in Foo: Object type: Foo: Field: x"
+        assert error.obj_type == "Foo"
+
+    def test_class_not_found_error(self):
+        """Test ClassNotFoundError message and attributes."""
+        error = ClassNotFoundError("Missing")
+        assert error.class_name == "Missing"
+        assert "Class 'Missing' not found in registry" in str(error)
+
+    def test_depth_limit_error(self):
+        """Test DepthLimitError message with and without the current depth."""
+        assert str(DepthLimitError(5)).startswith("Serialization depth limit (5) exceeded.")
+        error = DepthLimitError(5, current_depth=6)
+        assert "(current depth: 6)" in str(error)
+        assert error.max_depth == 5
+        assert error.current_depth == 6
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            SerializationError("boom", obj_type="Foo", field="bar"),
+            DeserializationError("boom", obj_type="Foo"),
+            ClassNotFoundError("Missing"),
+            DepthLimitError(5, current_depth=6),
+        ],
+    )
+    def test_pickle_round_trip_keeps_attributes(self, error):
+        """Test that slot attributes survive pickling."""
+        restored = pickle.loads(pickle.dumps(error))
+        assert type(restored) is type(error)
+        assert str(restored) == str(error)
+        for name in ("obj_type", "field", "class_name", "max_depth", "current_depth"):
+            assert getattr(restored, name, None) == getattr(error, name, None)
+
+    def test_pickle_round_trip_unknown_field_error(self):
+        """Test that UnknownFieldError can be unpickled despite its two-argument constructor."""
+        error = UnknownFieldError("x", "Foo")
+        restored = pickle.loads(pickle.dumps(error))
+        assert str(restored) == str(error)
+        assert restored.field_name == "x"
+        assert restored.obj_type == "Foo"
+
+    def test_validation_error(self):
+        """Test ValidationError message, attributes and pickling."""
+        assert str(ValidationError("bad")) == "bad"
+        error = ValidationError("bad", obj=[1, 2])
+        assert str(error) == "bad (object type: list)"
+        assert error.obj == [1, 2]
+        restored = pickle.loads(pickle.dumps(error))
+        assert str(restored) == str(error)
+        assert restored.obj == [1, 2]
+
+    def test_depth_limit_error_message_follows_argument_type(self):
+        """Test that equal depths of different types are formatted independently."""
+        assert "(5)" in str(DepthLimitError(5))
+        error = DepthLimitError(5.0)
+        assert "(5.0)" in str(error)
+        assert error.max_depth == 5.0
+
+    def test_unhashable_arguments_are_accepted(self):
+        """Test that exception constructors accept unhashable values."""
+        assert "Class '['x']' not found" in str(ClassNotFoundError(["x"]))
+        assert "(current depth: [1])" in str(DepthLimitError(5, current_depth=[1]))
+        assert "Unknown field '['x']'" in str(UnknownFieldError(["x"], "Foo"))
+
+    def test_validation_error_reports_real_type_of_proxies(self):
+        """Test that ValidationError is not fooled by objects spoofing __class__."""
+
+        class Foo:
+            pass
+
+        error = ValidationError("bad", obj=Mock(spec=Foo))
+        assert str(error) == "bad (object type: Mock)"
+
+    def test_pickle_user_subclass_with_string_slots(self):
+        """Test that a subclass declaring __slots__ as a single string pickles correctly."""
+        restored = pickle.loads(pickle.dumps(_StringSlotError("boom")))
+        assert restored.extra == "value"
+        assert str(restored) == "boom"
+
+
+class _StringSlotError(SerializationError):
+    __slots__ = "extra"
+
+    def __init__(self, message):
+        self.extra = "value"
+        super().__init__(message)
@@ -0,0 +1,62 @@
+"""
+Tests for lazy resolution of the public serilux API.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import serilux
+
+
+class TestLazyImports:
+    """Test PEP 562 lazy exports in the serilux package."""
+
+    def test_import_does_not_load_submodules(self):
+        """Test that a bare import leaves the implementation modules unloaded."""
+        code = (
+            "import sys, serilux; "
+            "assert 'serilux.serializable' not in sys.modules, 'serializable loaded'; "
+            "assert 'serilux.exceptions' not in sys.modules, 'exceptions loaded'"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=Path(serilux.__file__).parent.parent,
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_submodules_accessible_after_bare_import(self):
+        """Test that serilux.exceptions and serilux.serializable resolve after import serilux."""
+        code = (
+            "import serilux; "
+            "assert serilux.exceptions.SeriluxError is serilux.SeriluxError; "
+            "assert serilux.serializable.Serializable is serilux.Serializable"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=Path(serilux.__file__).parent.parent,
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="Nope"):
+            serilux.Nope
+
+    def test_star_import_binds_all_names(self):
+        """Test that from serilux import * binds every name in __all__."""
+        namespace = {}
+        exec("from serilux import *", namespace)
+        for name in serilux.__all__:
+            assert namespace[name] is getattr(serilux, name)
+
+    def test_dir_lists_lazy_names(self):
+        """Test that dir() includes names that have not been resolved yet."""
+        assert set(serilux.__all__) <= set(dir(serilux))
+        assert {"serializable", "exceptions"} <= set(dir(serilux))